@@ -52,7 +52,6 @@ setup(
     install_requires=[
         "editdistance~=0.8",
         "fairseq2n" + fairseq2n_version_spec,
-        "importlib_metadata~=7.0",
         "importlib_resources~=6.4",
         "mypy-extensions~=1.0",
         "numpy~=1.23",
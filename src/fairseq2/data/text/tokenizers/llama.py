@@ -6,7 +6,11 @@
 
 from __future__ import annotations
 
+import sys
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
+from threading import Lock
 from typing import Final, final
 
 from typing_extensions import override
@@ -26,9 +30,39 @@ from fairseq2.typing import Device
 class LLaMA3Tokenizer(TiktokenTokenizer):
     """Represents a LLaMA 3 tokenizer."""
 
+    # Note that the pattern is compiled by the native core of tiktoken when the
+    # underlying `Encoding` is constructed, not on every encode call. tiktoken
+    # does not accept a precompiled Python pattern object.
     _SPLIT_REGEX: Final = r"(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\p{L}\p{N}]?\p{L}+|\p{N}{1,3}| ?[^\s\p{L}\p{N}]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"  # fmt: skip
 
+    _BASE_SPECIAL_TOKENS: Final = (
+        "<|begin_of_text|>",
+        "<|end_of_text|>",
+        "<|reserved_special_token_0|>",
+        "<|reserved_special_token_1|>",
+        "<|finetune_right_pad_id|>",
+        "<|step_id|>",
+        "<|start_header_id|>",
+        "<|end_header_id|>",
+        "<|eom_id|>",  # end-of-message
+        "<|eot_id|>",  # end-of-turn
+        "<|python_tag|>",
+    )
+
+    _NUM_RESERVED_SPECIAL_TOKENS: Final = 256
+
+    # Interned so that lookups of the tokens compare by identity first.
+    _SPECIAL_TOKENS: Final = tuple(
+        sys.intern(token)
+        for token in _BASE_SPECIAL_TOKENS
+        + tuple(
+            f"<|reserved_special_token_{2 + i}|>"
+            for i in range(_NUM_RESERVED_SPECIAL_TOKENS - len(_BASE_SPECIAL_TOKENS))
+        )
+    )
+
     _eos_token: str
+    _mode_tokens: dict[str | None, tuple[tuple[str, ...], tuple[str, ...]]]
 
     def __init__(self, path: Path, instruct: bool = False) -> None:
         """
@@ -39,24 +73,18 @@ class LLaMA3Tokenizer(TiktokenTokenizer):
         """
         self._eos_token = "<|eot_id|>" if instruct else "<|end_of_text|>"
 
-        special_tokens = [
-            "<|begin_of_text|>",
-            "<|end_of_text|>",
-            "<|reserved_special_token_0|>",
-            "<|reserved_special_token_1|>",
-            "<|finetune_right_pad_id|>",
-            "<|step_id|>",
-            "<|start_header_id|>",
-            "<|end_header_id|>",
-            "<|eom_id|>",  # end-of-message
-            "<|eot_id|>",  # end-of-turn
-            "<|python_tag|>",
-        ]
-
-        num_reserved_special_tokens = 256
-
-        for i in range(num_reserved_special_tokens - len(special_tokens)):
-            special_tokens.append(f"<|reserved_special_token_{2 + i}|>")
+        bos = ("<|begin_of_text|>",)
+        eos = (self._eos_token,)
+
+        # Maps each mode to its prefix and suffix tokens.
+        self._mode_tokens = {
+            None: (bos, eos),
+            "default": (bos, eos),
+            # In prompt mode, we expect the generator to finish the sequence.
+            "prompt": (bos, ()),
+            "prompt_response": ((), eos),
+            "as_is": ((), ()),
+        }
 
         super().__init__(
             path,
@@ -67,7 +95,7 @@ class LLaMA3Tokenizer(TiktokenTokenizer):
             pad_token="<|finetune_right_pad_id|>",
             boh_token="<|start_header_id|>",
             eoh_token="<|end_header_id|>",
-            special_tokens=special_tokens,
+            special_tokens=self._SPECIAL_TOKENS,
         )
 
     @override
@@ -86,24 +114,12 @@ class LLaMA3Tokenizer(TiktokenTokenizer):
         if lang is not None:
             raise ValueError(f"`lang` must be `None`, but is '{lang}' instead.")
 
-        match mode:
-            case None | "default":
-                prefix_tokens = ["<|begin_of_text|>"]
-                suffix_tokens = [self._eos_token]
-            case "prompt":
-                prefix_tokens = ["<|begin_of_text|>"]
-                # In prompt mode, we expect the generator to finish the sequence.
-                suffix_tokens = []
-            case "prompt_response":
-                prefix_tokens = []
-                suffix_tokens = [self._eos_token]
-            case "as_is":
-                prefix_tokens = []
-                suffix_tokens = []
-            case _:
-                raise ValueError(
-                    f"`mode` must be one of the following values, but is '{mode}' instead: default, prompt, prompt_response, as_is"
-                )
+        try:
+            prefix_tokens, suffix_tokens = self._mode_tokens[mode]
+        except KeyError:
+            raise ValueError(
+                f"`mode` must be one of the following values, but is '{mode}' instead: default, prompt, prompt_response, as_is"
+            ) from None
 
         return TiktokenEncoder(
             self._encoding,
@@ -141,8 +157,12 @@ class LLaMATokenizerHandler(AbstractTextTokenizerHandler):
 
             eot_idx = 128_009  # end-of-turn
 
+            instruct = eos_idx == eot_idx
+
             try:
-                return LLaMA3Tokenizer(path, instruct=eos_idx == eot_idx)
+                return _load_cached_tokenizer(
+                    path, instruct, lambda: LLaMA3Tokenizer(path, instruct=instruct)
+                )
             except ValueError as ex:
                 raise AssetCardError(
                     card.name, f"The value of the `model_config.vocab_info.eos_idx` field of the '{card.name}' asset card does not represent a valid LLaMA tokenizer configuration. See the nested exception for details."  # fmt: skip
@@ -153,8 +173,77 @@ class LLaMATokenizerHandler(AbstractTextTokenizerHandler):
                 ) from ex
         else:
             try:
-                return BasicSentencePieceTokenizer(path)
+                return _load_cached_tokenizer(
+                    path, None, lambda: BasicSentencePieceTokenizer(path)
+                )
             except RuntimeError as ex:
                 raise TextTokenizerLoadError(
                     card.name, f"The '{card.name}' text tokenizer cannot be loaded. See the nested exception for details."  # fmt: skip
                 ) from ex
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the cache of loaded tokenizers."""
+        with _tokenizer_cache_lock:
+            _tokenizer_cache.clear()
+
+
+# Tokenizers are immutable once constructed, so asset cards that resolve to the
+# same tokenizer file can share a single instance instead of parsing the file
+# over and over again. The entries are keyed by the path and the mode of the
+# tokenizer, and are invalidated when the modification time or the size of the
+# file changes.
+_MAX_NUM_CACHED_TOKENIZERS: Final = 8
+
+_tokenizer_cache: OrderedDict[
+    tuple[str, bool | None], tuple[int, int, TextTokenizer]
+] = OrderedDict()
+
+_tokenizer_cache_lock = Lock()
+
+
+def _load_cached_tokenizer(
+    path: Path, instruct: bool | None, loader: Callable[[], TextTokenizer]
+) -> TextTokenizer:
+    try:
+        stat = path.stat()
+    except OSError:
+        # Let the tokenizer report the error.
+        return loader()
+
+    key = (str(path), instruct)
+
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    def get_cached_tokenizer() -> TextTokenizer | None:
+        entry = _tokenizer_cache.get(key)
+        if entry is None or entry[:2] != version:
+            return None
+
+        _tokenizer_cache.move_to_end(key)
+
+        return entry[2]
+
+    with _tokenizer_cache_lock:
+        tokenizer = get_cached_tokenizer()
+        if tokenizer is not None:
+            return tokenizer
+
+    # Load outside of the lock so that unrelated loads do not wait on each
+    # other.
+    tokenizer = loader()
+
+    with _tokenizer_cache_lock:
+        # Another thread might have loaded the same tokenizer in the meantime.
+        cached_tokenizer = get_cached_tokenizer()
+        if cached_tokenizer is not None:
+            return cached_tokenizer
+
+        _tokenizer_cache[key] = (*version, tokenizer)
+
+        _tokenizer_cache.move_to_end(key)
+
+        if len(_tokenizer_cache) > _MAX_NUM_CACHED_TOKENIZERS:
+            _tokenizer_cache.popitem(last=False)
+
+    return tokenizer
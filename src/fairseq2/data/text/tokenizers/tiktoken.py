@@ -6,9 +6,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import re
+from collections.abc import Iterator, Sequence
 from pathlib import Path
-from typing import final
+from typing import Final, final
 
 import torch
 from tiktoken import Encoding
@@ -173,7 +174,7 @@ class TiktokenEncoder(TextTokenEncoder):
 
     @override
     def __call__(self, text: str) -> Tensor:
-        indices = self._encoding.encode(text, allowed_special="all")
+        indices = self._encode(text)
 
         if self._prefix_indices:
             indices = self._prefix_indices + indices
@@ -185,6 +186,17 @@ class TiktokenEncoder(TextTokenEncoder):
             indices, dtype=torch.int64, device=self._device, pin_memory=self._pin_memory
         )
 
+    def _encode(self, text: str) -> list[int]:
+        if len(text) > _MAX_NO_WHITESPACE_CHARS:
+            indices: list[int] = []
+
+            for piece in _split_text(text):
+                indices.extend(self._encoding.encode(piece, allowed_special="all"))
+
+            return indices
+
+        return self._encoding.encode(text, allowed_special="all")
+
     @override
     def encode_as_tokens(self, text: str) -> list[str]:
         indices = self(text).tolist()
@@ -204,6 +216,38 @@ class TiktokenEncoder(TextTokenEncoder):
         return self._suffix_index_tensor
 
 
+# The native core of tiktoken can take excessively long (or even overflow its
+# stack) on inputs with very long runs of whitespace or non-whitespace
+# characters. Similar to the reference LLaMA 3 implementation, we split such
+# inputs before encoding them. Regular text is never affected by this.
+_MAX_ENCODE_CHARS: Final = 400_000
+
+_MAX_NO_WHITESPACE_CHARS: Final = 25_000
+
+_RUN_REGEX: Final = re.compile(r"\s+|\S+")
+
+
+def _split_text(text: str) -> Iterator[str]:
+    for offset in range(0, len(text), _MAX_ENCODE_CHARS):
+        chunk = text[offset : offset + _MAX_ENCODE_CHARS]
+
+        yield from _split_long_runs(chunk, _MAX_NO_WHITESPACE_CHARS)
+
+
+def _split_long_runs(text: str, max_run_len: int) -> Iterator[str]:
+    offset = 0
+
+    for match in _RUN_REGEX.finditer(text):
+        run_start, run_end = match.span()
+
+        for cut in range(run_start + max_run_len, run_end, max_run_len):
+            yield text[offset:cut]
+
+            offset = cut
+
+    yield text[offset:]
+
+
 @final
 class TiktokenDecoder(TextTokenDecoder):
     """Represents a tiktoken decoder."""
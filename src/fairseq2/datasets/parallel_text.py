@@ -15,6 +15,7 @@ from typing import Any, Final, cast, final
 from typing_extensions import override
 
 from fairseq2.data import (
+    CollateOptionsOverride,
     Collater,
     DataPipeline,
     DataPipelineBuilder,
@@ -49,6 +50,19 @@ class ParallelTextReadOptions(DataReadOptions):
     sample: bool = False
     """If ``True``, corpora will be sampled in proportion to their weights."""
 
+    source_pad_to_multiple: int = 1
+    """
+    The length of collated source sequences is rounded up to this multiple.
+    Bucketing source lengths keeps the number of distinct input shapes small,
+    which avoids recompilations of compiled models.
+    """
+
+    pin_memory: bool = False
+    """
+    If ``True``, collated batches will be copied into pinned memory in
+    background so that they can be transferred to a CUDA device asynchronously.
+    """
+
 
 @dataclass(unsafe_hash=True)  # Due to FSDP, we cannot freeze.
 class Direction:
@@ -386,10 +400,30 @@ class GenericParallelTextDataset(ParallelTextDataset):
         seed += 1
 
         # Collate bucketed examples into a batch.
-        collater = Collater(pad_value=tokenizer.vocab_info.pad_idx)
+        pad_idx = tokenizer.vocab_info.pad_idx
+
+        overrides = []
+
+        if options.source_pad_to_multiple > 1:
+            overrides.append(
+                CollateOptionsOverride(
+                    "source_indices",
+                    pad_value=pad_idx,
+                    pad_to_multiple=options.source_pad_to_multiple,
+                )
+            )
+
+        collater = Collater(pad_value=pad_idx, overrides=overrides)
 
         builder.map(collater, num_parallel_calls=npc)
 
+        # Copy batches into page-locked memory so that their transfer to the
+        # device can overlap with the computation of the previous batch.
+        pin_memory = options.pin_memory and gang.device.type == "cuda"
+
+        if pin_memory:
+            builder.map(self._pin_memory, num_parallel_calls=npc)
+
         # Return only the first `max_num_batches`.
         if options.max_num_batches is not None:
             builder.take(options.max_num_batches)
@@ -397,7 +431,7 @@ class GenericParallelTextDataset(ParallelTextDataset):
         # Prefetch `num_prefetch` batches in background.
         builder.prefetch(options.num_prefetch)
 
-        f = partial(self._to_batch, device=gang.device)
+        f = partial(self._to_batch, device=gang.device, non_blocking=pin_memory)
 
         pipeline = builder.map(f).and_return()
 
@@ -442,15 +476,29 @@ class GenericParallelTextDataset(ParallelTextDataset):
         )
 
     @staticmethod
-    def _to_batch(example: dict[str, Any], device: Device) -> Seq2SeqBatch:
+    def _pin_memory(example: dict[str, Any]) -> dict[str, Any]:
+        for key in ("source_indices", "target_indices"):
+            data = cast(SequenceData, example[key])
+
+            data["seqs"] = data["seqs"].pin_memory()
+
+            if data["is_ragged"]:
+                data["seq_lens"] = data["seq_lens"].pin_memory()
+
+        return example
+
+    @staticmethod
+    def _to_batch(
+        example: dict[str, Any], device: Device, non_blocking: bool = False
+    ) -> Seq2SeqBatch:
         source_data = cast(SequenceData, example["source_indices"])
         target_data = cast(SequenceData, example["target_indices"])
 
         source_seqs, source_padding_mask = get_seqs_and_padding_mask(
-            source_data, device
+            source_data, device, non_blocking=non_blocking
         )
         target_seqs, target_padding_mask = get_seqs_and_padding_mask(
-            target_data, device
+            target_data, device, non_blocking=non_blocking
         )
 
         return Seq2SeqBatch(
@@ -7,38 +7,60 @@
 from __future__ import annotations
 
 import os
-from typing import Any
-
-from importlib_metadata import entry_points
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 from fairseq2.logging import log
 
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
 
 def run_extensions(extension_name: str, *args: Any, **kwargs: Any) -> None:
     should_trace = "FAIRSEQ2_EXTENSION_TRACE" in os.environ
 
-    for entry_point in entry_points(group=extension_name):
+    for entry_point in _get_entry_points(extension_name):
+        name = entry_point.value
+
+        cause: Exception | None
+
         try:
             extension = entry_point.load()
 
             extension(*args, **kwargs)
         except TypeError:
-            if should_trace:
-                raise ExtensionError(
-                    entry_point.value, f"The '{entry_point.value}' entry point is not a valid extension function."  # fmt: skip
-                ) from None
+            message = f"The '{name}' entry point is not a valid extension function."
 
-            log.warning("The '{}' entry point is not a valid extension function. Set `FAIRSEQ2_EXTENSION_TRACE` environment variable to print the stack trace.", entry_point.value)  # fmt: skip
+            cause = None
         except Exception as ex:
+            message = f"The '{name}' extension function has failed."
+
+            cause = ex
+        else:
             if should_trace:
-                raise ExtensionError(
-                    entry_point.value, f"The '{entry_point.value}' extension function has failed. See the nested exception for details."  # fmt: skip
-                ) from ex
+                log.info("The `{}` extension function run successfully.", name)  # fmt: skip
 
-            log.warning("The '{}' extension function has failed. Set `FAIRSEQ2_EXTENSION_TRACE` environment variable to print the stack trace.", entry_point.value)  # fmt: skip
+            continue
 
         if should_trace:
-            log.info("The `{}` extension function run successfully.", entry_point.value)  # fmt: skip
+            if cause is not None:
+                message = f"{message} See the nested exception for details."
+
+            raise ExtensionError(name, message) from cause
+
+        log.warning("{} Set `FAIRSEQ2_EXTENSION_TRACE` environment variable to print the stack trace.", message)  # fmt: skip
+
+
+@cache
+def _get_entry_points(group: str) -> tuple[EntryPoint, ...]:
+    # Scanning the installed distributions is expensive, so we do it only once
+    # per group. Note that extensions installed after the first lookup won't be
+    # picked up unless `_get_entry_points.cache_clear()` is called.
+    #
+    # Imported lazily to avoid the import cost when no extension is run.
+    from importlib.metadata import entry_points
+
+    return tuple(entry_points(group=group))
 
 
 class ExtensionError(Exception):
@@ -200,7 +200,7 @@ class BeamSearchSeq2SeqGenerator(AbstractSeq2SeqGenerator):
     _algorithm: BeamSearchAlgorithm
     _beam_size: int
     _min_gen_len: int
-    _max_gen_len: tuple[int, int]
+    _max_gen_len: tuple[float, int]
     _max_seq_len: int
     _echo_prompt: bool
     _normalize_scores: bool
@@ -218,7 +218,7 @@ class BeamSearchSeq2SeqGenerator(AbstractSeq2SeqGenerator):
         algorithm: BeamSearchAlgorithm | None = None,
         beam_size: int = 5,
         min_gen_len: int = 1,
-        max_gen_len: tuple[int, int] = (1, 128),
+        max_gen_len: tuple[float, int] = (1, 128),
         max_seq_len: int | None = None,
         echo_prompt: bool = False,
         normalize_scores: bool = True,
@@ -314,11 +314,15 @@ class BeamSearchSeq2SeqGenerator(AbstractSeq2SeqGenerator):
         source_padding_mask: PaddingMask | None,
         prompt_seqs: Tensor,
         prompt_padding_mask: PaddingMask | None,
+        *,
+        encoder_output: Tensor | None = None,
+        encoder_padding_mask: PaddingMask | None = None,
     ) -> Seq2SeqGeneratorOutput:
-        # (P, S)
-        encoder_output, encoder_padding_mask = self.model.encode(
-            source_seqs, source_padding_mask
-        )
+        if encoder_output is None:
+            # (P, S)
+            encoder_output, encoder_padding_mask = self.model.encode(
+                source_seqs, source_padding_mask
+            )
 
         if source_padding_mask is None:
             max_source_len = source_seqs.size(1)
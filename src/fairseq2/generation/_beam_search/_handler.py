@@ -48,7 +48,7 @@ class BeamSearchConfig:
     min_gen_len: int = 1
     """The minimum generation length."""
 
-    max_gen_len: int | tuple[int, int] = 2048
+    max_gen_len: int | tuple[float, int] = 2048
     """The maximum generation length."""
 
     max_seq_len: int | None = None
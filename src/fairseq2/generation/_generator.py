@@ -153,6 +153,9 @@ class Seq2SeqGenerator(ABC):
         source_padding_mask: PaddingMask | None,
         prompt_seqs: Tensor,
         prompt_padding_mask: PaddingMask | None,
+        *,
+        encoder_output: Tensor | None = None,
+        encoder_padding_mask: PaddingMask | None = None,
     ) -> Seq2SeqGeneratorOutput:
         """
         :param source_seqs:
@@ -167,6 +170,16 @@ class Seq2SeqGenerator(ABC):
             is the batch size and :math:`S_{prm}` is the prompt sequence length.
         :param prompt_padding_mask:
             The padding mask of ``prompt_seqs``. *Shape:* Same as ``prompt_seqs``.
+        :param encoder_output:
+            The already computed encoder output of ``source_seqs``. If not
+            ``None``, the source sequences won't be encoded again. *Shape:*
+            :math:`(N,S_{enc},M)`, where :math:`N` is the batch size,
+            :math:`S_{enc}` is the encoder output sequence length, and
+            :math:`M` is the dimensionality of the model.
+        :param encoder_padding_mask:
+            The padding mask of ``encoder_output``. *Shape:*
+            :math:`(N,S_{enc})`, where :math:`N` is the batch size and
+            :math:`S_{enc}` is the encoder output sequence length.
         """
 
     @abstractmethod
@@ -203,7 +203,7 @@ class SamplingSeq2SeqGenerator(AbstractSeq2SeqGenerator):
     _sampler: Sampler
     _num_gens: int
     _min_gen_len: int
-    _max_gen_len: tuple[int, int]
+    _max_gen_len: tuple[float, int]
     _max_seq_len: int
     _echo_prompt: bool
     _compute_scores: bool
@@ -222,7 +222,7 @@ class SamplingSeq2SeqGenerator(AbstractSeq2SeqGenerator):
         *,
         num_gens: int = 1,
         min_gen_len: int = 1,
-        max_gen_len: tuple[int, int] = (1, 128),
+        max_gen_len: tuple[float, int] = (1, 128),
         max_seq_len: int | None = None,
         echo_prompt: bool = False,
         compute_scores: bool = False,
@@ -322,11 +322,15 @@ class SamplingSeq2SeqGenerator(AbstractSeq2SeqGenerator):
         source_padding_mask: PaddingMask | None,
         prompt_seqs: Tensor,
         prompt_padding_mask: PaddingMask | None,
+        *,
+        encoder_output: Tensor | None = None,
+        encoder_padding_mask: PaddingMask | None = None,
     ) -> Seq2SeqGeneratorOutput:
-        # (P, S)
-        encoder_output, encoder_padding_mask = self.model.encode(
-            source_seqs, source_padding_mask
-        )
+        if encoder_output is None:
+            # (P, S)
+            encoder_output, encoder_padding_mask = self.model.encode(
+                source_seqs, source_padding_mask
+            )
 
         if source_padding_mask is None:
             max_source_len = source_seqs.size(1)
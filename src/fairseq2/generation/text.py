@@ -25,6 +25,7 @@ from fairseq2.generation import (
 )
 from fairseq2.nn.padding import PaddingMask, pad_seqs
 from fairseq2.nn.utils.module import infer_device
+from fairseq2.typing import Device
 
 
 @final
@@ -32,6 +33,10 @@ class SequenceToTextConverter:
     """Converts source sequences to text."""
 
     _generator: Seq2SeqGenerator
+    _tokenizer: TextTokenizer
+    _task: str
+    _device: Device
+    _target_prefix_seqs: dict[str | None, Tensor]
     _target_prefix_seq: Tensor
     _text_decoder: TextTokenDecoder
 
@@ -55,26 +60,44 @@ class SequenceToTextConverter:
         self._generator = generator
 
         try:
-            device = infer_device(generator.model)
+            self._device = infer_device(generator.model)
         except ValueError as ex:
             raise ValueError(
                 "The device of `generator.model` is not valid. See the nested exception for details."
             ) from ex
 
-        target_text_encoder = tokenizer.create_encoder(
-            task=task, lang=target_lang, mode="target", device=device
-        )
+        self._tokenizer = tokenizer
+
+        self._task = task
+
+        self._target_prefix_seqs = {}
+
+        self.set_target_lang(target_lang)
 
-        # (S)
-        target_prefix_seq = target_text_encoder.prefix_indices
+        self._text_decoder = tokenizer.create_decoder()
+
+    def set_target_lang(self, target_lang: str | None) -> None:
+        """Set the target language for conversion.
+
+        The target prefix sequence of each language is computed once, so
+        switching between languages is cheap.
+        """
+        target_prefix_seq = self._target_prefix_seqs.get(target_lang)
         if target_prefix_seq is None:
-            raise ValueError(
-                "`tokenizer` must specify a prefix sequence for the target language."
+            target_text_encoder = self._tokenizer.create_encoder(
+                task=self._task, lang=target_lang, mode="target", device=self._device
             )
 
-        self._target_prefix_seq = target_prefix_seq
+            # (S)
+            target_prefix_seq = target_text_encoder.prefix_indices
+            if target_prefix_seq is None:
+                raise ValueError(
+                    "`tokenizer` must specify a prefix sequence for the target language."
+                )
 
-        self._text_decoder = tokenizer.create_decoder()
+            self._target_prefix_seqs[target_lang] = target_prefix_seq
+
+        self._target_prefix_seq = target_prefix_seq
 
     def __call__(self, source_seq: Tensor) -> tuple[str, Seq2SeqGeneratorOutput]:
         """
@@ -97,6 +120,9 @@ class SequenceToTextConverter:
         self,
         source_seqs: Tensor,
         source_padding_mask: PaddingMask | None,
+        *,
+        encoder_output: Tensor | None = None,
+        encoder_padding_mask: PaddingMask | None = None,
     ) -> tuple[list[str], Seq2SeqGeneratorOutput]:
         """
         :param source_seqs:
@@ -106,6 +132,11 @@ class SequenceToTextConverter:
         :param source_padding_mask:
             The padding mask of ``source_seqs``. *Shape:* :math:`(N,S)`, where
             :math:`N` is the batch size and :math:`S` is the sequence length.
+        :param encoder_output:
+            The already computed encoder output of ``source_seqs``. See
+            :meth:`Seq2SeqGenerator.__call__`.
+        :param encoder_padding_mask:
+            The padding mask of ``encoder_output``.
 
         :returns:
             - The converted texts.
@@ -116,12 +147,20 @@ class SequenceToTextConverter:
                 "`source_seqs` must contain at least one element, but is empty instead."
             )
 
-        return self._do_convert(source_seqs, source_padding_mask)
+        return self._do_convert(
+            source_seqs,
+            source_padding_mask,
+            encoder_output=encoder_output,
+            encoder_padding_mask=encoder_padding_mask,
+        )
 
     def _do_convert(
         self,
         source_seqs: Tensor,
         source_padding_mask: PaddingMask | None,
+        *,
+        encoder_output: Tensor | None = None,
+        encoder_padding_mask: PaddingMask | None = None,
     ) -> tuple[list[str], Seq2SeqGeneratorOutput]:
         """A subclass should call this method for actual text conversion.
 
@@ -143,7 +182,12 @@ class SequenceToTextConverter:
         target_prefix_seqs = self._target_prefix_seq.expand(batch_size, -1)
 
         generator_output = self._generator(
-            source_seqs, source_padding_mask, target_prefix_seqs, None
+            source_seqs,
+            source_padding_mask,
+            target_prefix_seqs,
+            None,
+            encoder_output=encoder_output,
+            encoder_padding_mask=encoder_padding_mask,
         )
 
         texts: list[str] = []
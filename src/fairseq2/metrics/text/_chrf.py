@@ -49,8 +49,14 @@ class ChrfMetric(Metric[Tensor]):
 
         all_stats = chrf._extract_corpus_statistics(hyps, [refs])
 
-        for stats in all_stats:
-            self.stats += torch.tensor(stats, device=self.device, dtype=torch.int64)
+        if not all_stats:
+            return self
+
+        # Sum the per-sentence statistics on host to avoid a device transfer
+        # per sentence.
+        stats = [sum(column) for column in zip(*all_stats)]
+
+        self.stats += torch.tensor(stats, device=self.device, dtype=torch.int64)
 
         return self
 
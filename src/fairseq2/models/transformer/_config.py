@@ -16,7 +16,7 @@ from fairseq2.nn.transformer import TransformerNormOrder
 TRANSFORMER_MODEL_FAMILY: Final = "transformer"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TransformerConfig:
     """Holds the configuration of a Transformer model.
 
@@ -49,6 +49,8 @@ class TransformerFactory:
 
         embed = self.create_embedding()
 
+        # The encoder and the decoder share the same frontend; therefore also
+        # the same embedding table and position encoder.
         frontend = self.create_frontend(embed)
 
         encoder = self.create_encoder()
@@ -145,6 +145,8 @@ class SinusoidalPositionEncoder(PositionEncoder):
             (max_seq_len, encoding_dim), device=device, dtype=torch.float32
         )
 
+        # The table is fully determined by the constructor arguments, so it is
+        # not stored in checkpoints and gets recomputed on (re)initialization.
         self.register_buffer("freqs", freqs, persistent=False)
 
         # This is a legacy parameter that should only be set when the encodings
@@ -162,10 +162,16 @@ def apply_padding_mask(
 
 
 def get_seqs_and_padding_mask(
-    data: SequenceData, device: Device | None = None
+    data: SequenceData, device: Device | None = None, *, non_blocking: bool = False
 ) -> tuple[Tensor, PaddingMask | None]:
     """Return the sequences along with their padding mask from ``data``.
 
+    :param device:
+        The device to which to move the sequences and their lengths.
+    :param non_blocking:
+        If ``True``, the transfer to ``device`` is performed asynchronously if
+        the tensors are in pinned memory.
+
     :returns:
         - The sequences (i.e. `data["seqs"]`)
         - The padding mask of the returned sequences.
@@ -173,7 +179,7 @@ def get_seqs_and_padding_mask(
     seqs = data["seqs"]
 
     if device is not None:
-        seqs = seqs.to(device)
+        seqs = seqs.to(device, non_blocking=non_blocking)
 
     if not data["is_ragged"]:
         return seqs, None
@@ -181,7 +187,7 @@ def get_seqs_and_padding_mask(
     seq_lens = data["seq_lens"]
 
     if device is not None:
-        seq_lens = seq_lens.to(device)
+        seq_lens = seq_lens.to(device, non_blocking=non_blocking)
 
     return seqs, PaddingMask(seq_lens, batch_seq_len=seqs.size(1))
 
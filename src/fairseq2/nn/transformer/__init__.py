@@ -10,6 +10,7 @@ from fairseq2.nn.transformer._attention import SDPA as SDPA
 from fairseq2.nn.transformer._attention import NaiveSDPA as NaiveSDPA
 from fairseq2.nn.transformer._attention import SDPAFactory as SDPAFactory
 from fairseq2.nn.transformer._attention import TorchSDPA as TorchSDPA
+from fairseq2.nn.transformer._attention import compile_torch_sdpa as compile_torch_sdpa
 from fairseq2.nn.transformer._attention import (
     create_default_sdpa as create_default_sdpa,
 )
@@ -184,6 +184,14 @@ def enable_memory_efficient_torch_sdpa(module: Module, value: bool) -> None:
             m.enable_memory_efficient(value)
 
 
+def compile_torch_sdpa(module: Module) -> None:
+    """Compile the PyTorch SDPA modules of ``module`` in-place with
+    ``torch.compile``."""
+    for m in module.modules():
+        if isinstance(m, TorchSDPA):
+            m.compile()
+
+
 try:
     from torch.backends.cuda import enable_mem_efficient_sdp, mem_efficient_sdp_enabled
 
@@ -301,7 +301,12 @@ def create_trainer(
         profile_dir = output_dir.joinpath("tb")
 
         profiler = TorchProfiler(
-            num_skip_steps, num_record_steps, profile_dir, gangs.root
+            num_skip_steps,
+            num_record_steps,
+            profile_dir,
+            gangs.root,
+            record_shapes=trainer.profile_record_shapes,
+            with_stack=trainer.profile_with_stack,
         )
     else:
         profiler = NoopProfiler()
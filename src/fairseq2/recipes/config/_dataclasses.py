@@ -108,6 +108,12 @@ class TrainerSection:
     profile: tuple[int, int] | None = None
     """The number of steps that the PyTorch profiler should skip and then record."""
 
+    profile_record_shapes: bool = False
+    """If ``True``, the PyTorch profiler records the input shapes of operators."""
+
+    profile_with_stack: bool = False
+    """If ``True``, the PyTorch profiler records the Python stack of operators."""
+
     anomaly_detection: bool = False
     """If ``True``, turns on anomaly detection feature in ``torch.autograd``."""
 
@@ -10,7 +10,8 @@ from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from contextlib import AbstractContextManager, nullcontext
 from itertools import count
-from typing import Generic, TypeVar, final
+from time import perf_counter
+from typing import Any, Generic, TypeVar, final
 
 import torch
 from torch.nn import Module
@@ -24,7 +25,7 @@ from fairseq2.metrics import MetricBag
 from fairseq2.metrics.recorders import MetricRecorder, record_metrics
 from fairseq2.recipes.metrics import extend_batch_metrics
 from fairseq2.recipes.utils.rich import create_rich_progress
-from fairseq2.typing import CPU, DataType
+from fairseq2.typing import CPU, DataType, Device
 from fairseq2.utils.profiler import Stopwatch
 from fairseq2.utils.rng import RngBag
 
@@ -42,6 +43,12 @@ class EvalUnit(ABC, Generic[BatchT_contra]):
     def set_step_nr(self, step_nr: int) -> None:
         """Set the current training step number."""
 
+    def finalize(self) -> None:
+        """
+        Finalize the unit after the last batch of an evaluation run. Does
+        nothing by default.
+        """
+
     @property
     @abstractmethod
     def model(self) -> Module:
@@ -116,7 +123,9 @@ class Evaluator(Generic[BatchT]):
     ) -> None:
         """
         :param units: The evaluation units.
-        :param data_readers: The data readers of ``units``.
+        :param data_readers: The data readers of ``units``. Consecutive units
+            that share the same data reader are evaluated in a single pass over
+            its data.
         :param wall_watch: The stopwatch to track process wall-time.
         :param dtype: The data type of the model.
         :param amp: If ``True``, enables ``torch.amp``.
@@ -176,18 +185,37 @@ class Evaluator(Generic[BatchT]):
 
         rng_bag.manual_seed(self._seed)
 
+        unit_groups: list[tuple[list[EvalUnit[BatchT]], DataReader[BatchT]]] = []
+
+        # Group consecutive units that share a data reader so that its data is
+        # read only once.
         for unit, data_reader in zip(self._units, self._data_readers):
-            if unit.display_name:
-                log.info("Evaluating {}.", unit.display_name)
+            if unit_groups and unit_groups[-1][1] is data_reader:
+                unit_groups[-1][0].append(unit)
+            else:
+                unit_groups.append(([unit], data_reader))
 
-            self._evaluate_unit(unit, data_reader)
+        for units, data_reader in unit_groups:
+            for unit in units:
+                if unit.display_name:
+                    log.info("Evaluating {}.", unit.display_name)
 
-    def _evaluate_unit(
-        self, unit: EvalUnit[BatchT], data_reader: DataReader[BatchT]
+            self._evaluate_units(units, data_reader)
+
+    def _evaluate_units(
+        self, units: Sequence[EvalUnit[BatchT]], data_reader: DataReader[BatchT]
     ) -> None:
-        watch = Stopwatch(start=True, device=self._gangs.root.device)
+        device = self._gangs.root.device
+
+        # Each unit is timed separately so that its reported throughput is not
+        # diluted by the other units of its group. The time spent reading the
+        # shared data is added to all of them.
+        read_timer = _AccumulatingTimer(device)
+
+        unit_timers = [_AccumulatingTimer(device) for _ in units]
 
-        unit.model.eval()
+        for unit in units:
+            unit.model.eval()
 
         num_effective_batches = 0
 
@@ -200,17 +228,28 @@ class Evaluator(Generic[BatchT]):
                 log.debug("Running step {}.", step_nr)
 
                 try:
-                    batches = next(data_reader)
+                    with read_timer:
+                        batches = next(data_reader)
                 except StopIteration:
                     break
 
                 for batch in batches:
-                    with self._maybe_autocast():
-                        unit(batch)
+                    for unit, unit_timer in zip(units, unit_timers):
+                        with unit_timer, self._maybe_autocast():
+                            unit(batch)
 
                 num_effective_batches += 1
 
-        self._publish_metrics(unit, num_effective_batches, watch.get_elapsed_time())
+        for unit, unit_timer in zip(units, unit_timers):
+            with unit_timer:
+                unit.finalize()
+
+        read_time = read_timer.get_elapsed_time()
+
+        for unit, unit_timer in zip(units, unit_timers):
+            elapsed_time = read_time + unit_timer.get_elapsed_time()
+
+            self._publish_metrics(unit, num_effective_batches, elapsed_time)
 
     def _maybe_autocast(self) -> AbstractContextManager[None]:
         if self._dtype == torch.float32 or not self._amp:
@@ -252,3 +291,55 @@ class Evaluator(Generic[BatchT]):
             run_name = "eval"
 
         record_metrics(self._metric_recorders, run_name, values)
+
+
+@final
+class _AccumulatingTimer:
+    """
+    Accumulates the time spent in the blocks it is entered for. For CUDA
+    devices, the blocks are timed with CUDA events, so only reading the elapsed
+    time waits for the queued operations to complete.
+    """
+
+    _device: Device
+    _host_time: float
+    _start_time: float
+    _events: list[tuple[torch.cuda.Event, torch.cuda.Event]]
+
+    def __init__(self, device: Device) -> None:
+        self._device = device
+
+        self._host_time = 0.0
+
+        self._start_time = 0.0
+
+        self._events = []
+
+    def __enter__(self) -> None:
+        if self._device.type == "cuda":
+            start_event = torch.cuda.Event(enable_timing=True)
+            end_event = torch.cuda.Event(enable_timing=True)
+
+            start_event.record(torch.cuda.current_stream(self._device))
+
+            self._events.append((start_event, end_event))
+        else:
+            self._start_time = perf_counter()
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._device.type == "cuda":
+            end_event = self._events[-1][1]
+
+            end_event.record(torch.cuda.current_stream(self._device))
+        else:
+            self._host_time += perf_counter() - self._start_time
+
+    def get_elapsed_time(self) -> float:
+        """Return the total time spent in the timed blocks."""
+        if not self._events:
+            return self._host_time
+
+        self._events[-1][1].synchronize()
+
+        # CUDA events report milliseconds.
+        return sum(s.elapsed_time(e) for s, e in self._events) / 1000.0
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from fairseq2.recipes.mt._common import MTCriterion as MTCriterion
 from fairseq2.recipes.mt._eval import MTBleuChrfEvalUnit as MTBleuChrfEvalUnit
+from fairseq2.recipes.mt._eval import MTEncoderOutputCache as MTEncoderOutputCache
 from fairseq2.recipes.mt._eval import MTEvalConfig as MTEvalConfig
 from fairseq2.recipes.mt._eval import MTEvalDatasetSection as MTEvalDatasetSection
 from fairseq2.recipes.mt._eval import MTEvaluatorSection as MTEvaluatorSection
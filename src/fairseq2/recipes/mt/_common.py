@@ -9,11 +9,14 @@ from __future__ import annotations
 from typing import final
 
 from torch import Tensor
+from torch.distributed.fsdp import FullyShardedDataParallel as FSDP
 from torch.nn import Module
+from torch.nn.parallel import DistributedDataParallel as DDP
 
 from fairseq2.models.encoder_decoder import EncoderDecoderModel
 from fairseq2.models.seq2seq import Seq2SeqBatch, as_auto_regressive_input
 from fairseq2.models.sequence import SequenceModelOutput
+from fairseq2.nn.padding import PaddingMask
 from fairseq2.recipes.common import check_model_type
 from fairseq2.recipes.metrics import Seq2SeqMetricBag
 
@@ -21,6 +24,7 @@ from fairseq2.recipes.metrics import Seq2SeqMetricBag
 @final
 class MTCriterion:
     _model: Module
+    _base_model: EncoderDecoderModel
     _label_smoothing: float
 
     def __init__(self, model: Module, *, label_smoothing: float = 0.0) -> None:
@@ -28,14 +32,36 @@ class MTCriterion:
 
         self._model = model
 
+        # `encode()` and `_decode()` call the model's methods directly, which a
+        # DDP or FSDP wrapper does not expose.
+        if isinstance(model, (DDP, FSDP)):
+            base_model = model.module
+        else:
+            base_model = model
+
+        if not isinstance(base_model, EncoderDecoderModel):
+            raise TypeError(
+                f"`model` must be of type `{EncoderDecoderModel}`, but is of type `{type(base_model)}` instead."
+            )
+
+        self._base_model = base_model
+
         self._label_smoothing = label_smoothing
 
     def __call__(
-        self, batch: Seq2SeqBatch, metric_bag: Seq2SeqMetricBag
+        self,
+        batch: Seq2SeqBatch,
+        metric_bag: Seq2SeqMetricBag,
+        *,
+        encoder_output: Tensor | None = None,
+        encoder_padding_mask: PaddingMask | None = None,
     ) -> tuple[Tensor, int]:
         input_batch, target_batch = as_auto_regressive_input(batch)
 
-        output = self._forward(input_batch)
+        if encoder_output is None:
+            output = self._forward(input_batch)
+        else:
+            output = self._decode(input_batch, encoder_output, encoder_padding_mask)
 
         loss = output.compute_loss(
             target_batch.seqs, label_smoothing=self._label_smoothing
@@ -50,6 +76,31 @@ class MTCriterion:
     def _forward(self, batch: Seq2SeqBatch) -> SequenceModelOutput:
         return self._model(batch)  # type: ignore[no-any-return]
 
+    def encode(self, batch: Seq2SeqBatch) -> tuple[Tensor, PaddingMask | None]:
+        """Encode the source sequences of ``batch``.
+
+        The returned encoder output can be passed to :meth:`__call__` to avoid
+        encoding ``batch`` twice.
+        """
+        return self._base_model.encode(batch.source_seqs, batch.source_padding_mask)
+
+    def _decode(
+        self,
+        batch: Seq2SeqBatch,
+        encoder_output: Tensor,
+        encoder_padding_mask: PaddingMask | None,
+    ) -> SequenceModelOutput:
+        model = self._base_model
+
+        decoder_output, decoder_padding_mask = model.decode(
+            batch.target_seqs,
+            batch.target_padding_mask,
+            encoder_output,
+            encoder_padding_mask,
+        )
+
+        return model.project(decoder_output, decoder_padding_mask)
+
     @property
     def model(self) -> Module:
         return self._model
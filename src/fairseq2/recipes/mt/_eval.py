@@ -6,16 +6,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import csv
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Iterable, Mapping, TextIO, final
+from typing import TYPE_CHECKING, Final, Iterable, Mapping, TextIO, cast, final
 
 import torch
+from torch import Tensor
+from torch.nn.functional import linear
 from typing_extensions import override
 
 from fairseq2.context import RuntimeContext
 from fairseq2.data.text.tokenizers import TextTokenizer
-from fairseq2.datasets import Batching, LengthBatching, StaticBatching, SyncMode
+from fairseq2.datasets import LengthBatching, SyncMode
 from fairseq2.datasets.parallel_text import (
     GENERIC_PARALLEL_TEXT_DATASET_FAMILY,
     Direction,
@@ -30,6 +33,9 @@ from fairseq2.logging import log
 from fairseq2.metrics.text import BleuMetric, ChrfMetric
 from fairseq2.models.encoder_decoder import EncoderDecoderModel
 from fairseq2.models.seq2seq import Seq2SeqBatch
+from fairseq2.nn import Linear, Projection, TiedProjection
+from fairseq2.nn.padding import PaddingMask
+from fairseq2.nn.transformer import compile_torch_sdpa
 from fairseq2.nn.utils.module import remove_parametrizations
 from fairseq2.recipes.common import (
     broadcast_model,
@@ -52,11 +58,14 @@ from fairseq2.recipes.evaluator import AbstractEvalUnit, Evaluator, EvalUnit
 from fairseq2.recipes.metrics import Seq2SeqGenerationMetricBag, Seq2SeqMetricBag
 from fairseq2.recipes.mt._common import MTCriterion
 from fairseq2.recipes.utils.log import log_model
-from fairseq2.typing import CPU
+from fairseq2.typing import CPU, DataType
 from fairseq2.utils.config import process_config
 from fairseq2.utils.file import FileMode
 from fairseq2.utils.rng import manual_seed
 
+if TYPE_CHECKING:
+    from _csv import _writer
+
 
 @dataclass(kw_only=True)
 class MTEvalConfig(EvalRecipeConfig):
@@ -96,18 +105,52 @@ class MTEvalDatasetSection(DatasetSection):
     max_seq_len: int = 512
     """The maximum sequence length."""
 
+    source_pad_to_multiple: int = 32
+    """The length of source batches is rounded up to this multiple so that the
+    compiled model sees a bounded number of shapes. Only effective if
+    ``evaluator.torch_compile`` is set."""
+
     max_num_tokens: int = 4096
     """The maximum number of tokens per batch."""
 
     num_prefetch: int = 4
     """The number of batches to prefetch in background."""
 
+    target_to_source_len_ratio_mean: float | None = None
+    """The mean ratio of target to source sequence lengths in the dataset. If
+    not ``None``, the maximum generation length of each batch is derived from
+    the source length as ``ceil((mean + 2 * std) * source_len) + 1`` (at most
+    one step more if the product is integral) instead of the ``max_gen_len`` of
+    the beam search generator configuration. Must be greater than zero."""
+
+    target_to_source_len_ratio_std: float = 0.0
+    """The standard deviation of the ratio of target to source sequence lengths
+    in the dataset. Must be greater than or equal to zero."""
+
 
 @dataclass(kw_only=True)
 class MTEvaluatorSection(EvaluatorSection):
     label_smoothing: float = 0.1
     """The amount of label smoothing to apply while computing the loss."""
 
+    compile_sdpa: bool = True
+    """If ``True`` and :attr:`torch_compile` is set, compiles the scaled
+    dot-product attention modules of the model, which are also used during
+    generation."""
+
+    fast_eval: bool = False
+    """If ``True``, uses greedy decoding (i.e. a beam size of 1) for BLEU/chrF++
+    evaluation regardless of the configured beam size. Useful for quick smoke
+    tests since the decoding cost grows roughly linearly with the beam size."""
+
+    dtype_logits: DataType | None = None
+    """If not ``None``, the data type in which the final projection computes
+    the logits. Running it in higher precision than :attr:`dtype` avoids
+    overflows in the logits of large vocabularies, but each forward call then
+    holds a temporary copy of the projection weight in this data type (e.g.
+    ~1 GiB in ``torch.float32`` for a 256k x 1024 vocabulary). Has no effect if
+    :attr:`amp` is set."""
+
 
 def register_mt_eval_configs(context: RuntimeContext) -> None:
     registry = context.get_config_registry(MTEvalConfig)
@@ -127,6 +170,19 @@ def load_mt_evaluator(
 
     process_config(context, config)
 
+    ratio_mean = config.dataset.target_to_source_len_ratio_mean
+    if ratio_mean is not None:
+        if ratio_mean <= 0.0:
+            raise ValueError(
+                f"`config.dataset.target_to_source_len_ratio_mean` must be greater than zero, but is {ratio_mean} instead."
+            )
+
+        ratio_std = config.dataset.target_to_source_len_ratio_std
+        if ratio_std < 0.0:
+            raise ValueError(
+                f"`config.dataset.target_to_source_len_ratio_std` must be greater than or equal to zero, but is {ratio_std} instead."
+            )
+
     gangs = setup_gangs(context, config.gang)
 
     dataset = load_dataset(ParallelTextDataset, context, config.dataset, gangs)
@@ -152,15 +208,47 @@ def load_mt_evaluator(
 
     remove_parametrizations(model)
 
+    dtype_logits = config.evaluator.dtype_logits
+
+    if dtype_logits is not None and not config.evaluator.amp:
+        if dtype_logits != config.evaluator.dtype:
+            _set_logits_dtype(model, dtype_logits)
+
     log_model(log, model, gangs)
 
     if config.evaluator.torch_compile:
         model = compile_eval_model(context, config.model, model)
 
+        if config.evaluator.compile_sdpa:
+            compile_torch_sdpa(model)
+
     # Initialize the units.
-    seq2seq_generator = create_seq2seq_generator(
-        context, config.seq2seq_generator, model
-    )
+    generator_section = config.seq2seq_generator
+
+    generator_config = generator_section.config
+
+    if isinstance(generator_config, BeamSearchConfig):
+        if config.evaluator.fast_eval:
+            generator_config = replace(generator_config, beam_size=1)
+
+        if ratio_mean is not None:
+            ratio_std = config.dataset.target_to_source_len_ratio_std
+
+            # The generator computes the length cap per batch relative to the
+            # longest source sequence as `int(a * source_len + b)`, which floors.
+            # One extra step rounds the product up, and another one leaves room
+            # for EOS.
+            max_gen_len = (ratio_mean + 2 * ratio_std, 2)
+
+            log.info("Overriding `max_gen_len` of the generator with {} based on the target to source length ratio of the dataset.", max_gen_len)  # fmt: skip
+
+            generator_config = replace(generator_config, max_gen_len=max_gen_len)
+
+        generator_section = replace(generator_section, config=generator_config)
+    elif config.evaluator.fast_eval:
+        log.warning("`evaluator.fast_eval` is only supported with beam search and will be ignored.")  # fmt: skip
+
+    seq2seq_generator = create_seq2seq_generator(context, generator_section, model)
 
     criterion = MTCriterion(model, label_smoothing=config.evaluator.label_smoothing)
 
@@ -168,12 +256,24 @@ def load_mt_evaluator(
 
     data_readers = []
 
+    # Shared by all directions; the target language is switched per unit.
+    converter: SequenceToTextConverter | None = None
+
     for direction in dataset.directions(config.dataset.split):
-        loss_unit = MTLossEvalUnit(criterion, direction, gangs)
+        encoder_output_cache = MTEncoderOutputCache()
+
+        loss_unit = MTLossEvalUnit(
+            criterion, direction, gangs, encoder_output_cache=encoder_output_cache
+        )
 
         units.append(loss_unit)
 
-        batching: Batching = LengthBatching(config.dataset.max_num_tokens)
+        batching = LengthBatching(config.dataset.max_num_tokens)
+
+        if config.evaluator.torch_compile:
+            source_pad_to_multiple = config.dataset.source_pad_to_multiple
+        else:
+            source_pad_to_multiple = 1
 
         read_options = ParallelTextReadOptions(
             batching=batching,
@@ -181,6 +281,8 @@ def load_mt_evaluator(
             sync_mode=SyncMode.UNTIL_LAST,
             num_prefetch=config.dataset.num_prefetch,
             seed=seed,
+            source_pad_to_multiple=source_pad_to_multiple,
+            pin_memory=True,
         )
 
         data_reader = dataset.create_reader(
@@ -202,105 +304,192 @@ def load_mt_evaluator(
 
             rank = gangs.dp.rank
 
-            src_file = output_dir.joinpath(
-                f"translations/{direction}/rank_{rank}.src.txt"
-            )
-            ref_file = output_dir.joinpath(
-                f"translations/{direction}/rank_{rank}.ref.txt"
-            )
-            hyp_file = output_dir.joinpath(
-                f"translations/{direction}/rank_{rank}.hyp.txt"
+            # A single file per rank and direction keeps the number of files,
+            # and therefore the metadata operations, on shared file systems low.
+            output_file = output_dir.joinpath(
+                f"translations/{direction}/rank_{rank}.tsv"
             )
 
             try:
-                file_system.make_directory(src_file.parent)
-            except OSError as ex:
-                raise SetupError(
-                    f"The '{src_file.parent}' output directory cannot be created. See the nested exception for details."
-                ) from ex
-
-            try:
-                src_fp = file_system.open_text(src_file, mode=FileMode.WRITE)
+                file_system.make_directory(output_file.parent)
             except OSError as ex:
                 raise SetupError(
-                    f"The '{src_file}' output file cannot be created. See the nested exception for details."
+                    f"The '{output_file.parent}' output directory cannot be created. See the nested exception for details."
                 ) from ex
 
             try:
-                ref_fp = file_system.open_text(ref_file, mode=FileMode.WRITE)
+                output_fp = file_system.open_text(
+                    output_file, mode=FileMode.WRITE, buffering=_DUMP_BUFFER_SIZE
+                )
             except OSError as ex:
                 raise SetupError(
-                    f"The '{ref_file}' output file cannot be created. See the nested exception for details."
-                ) from ex
-
-            try:
-                hyp_fp = file_system.open_text(hyp_file, mode=FileMode.WRITE)
-            except OSError as ex:
-                raise SetupError(
-                    f"The '{hyp_file}' output file cannot be created. See the nested exception for details."
+                    f"The '{output_file}' output file cannot be created. See the nested exception for details."
                 ) from ex
         else:
-            src_fp = None
-            ref_fp = None
-            hyp_fp = None
+            output_fp = None
+
+        if converter is None:
+            converter = SequenceToTextConverter(
+                seq2seq_generator, tokenizer, "translation", direction.target_lang
+            )
 
         score_unit = MTBleuChrfEvalUnit(
             direction,
             seq2seq_generator,
             tokenizer,
             gangs,
-            src_output_stream=src_fp,
-            ref_output_stream=ref_fp,
-            hyp_output_stream=hyp_fp,
+            converter=converter,
+            max_batch_size=config.seq2seq_generator.batch_size,
+            encoder_output_cache=encoder_output_cache,
+            output_stream=output_fp,
         )
 
         units.append(score_unit)
 
-        batching = StaticBatching(config.seq2seq_generator.batch_size)
-
-        read_options = ParallelTextReadOptions(
-            direction=direction,
-            batching=batching,
-            sync_mode=SyncMode.UNTIL_LAST,
-            num_prefetch=config.dataset.num_prefetch,
-            seed=seed,
-        )
-
-        data_reader = dataset.create_reader(
-            config.dataset.split,
-            tokenizer,
-            gangs.dp,
-            config.dataset.min_seq_len,
-            config.dataset.max_seq_len,
-            read_options,
-        )
-
+        # The score unit shares the data reader of the loss unit so that the
+        # split is read and tokenized only once per direction.
         data_readers.append(data_reader)
 
-        seed += 1
-
     return create_evaluator(
         context, config, output_dir, units, data_readers, gangs, seed
     )
 
 
+def _set_logits_dtype(model: EncoderDecoderModel, dtype: DataType) -> None:
+    final_proj = getattr(model, "final_proj", None)
+    if not isinstance(final_proj, (Linear, TiedProjection)):
+        log.warning("`evaluator.dtype_logits` is ignored since the model has no supported final projection.")  # fmt: skip
+
+        return
+
+    # Note that we must not cast `final_proj` in-place; its weight can be tied
+    # to the embedding table of the model.
+    setattr(model, "final_proj", _CastProjection(final_proj, dtype))
+
+
+@final
+class _CastProjection(Projection):
+    """Computes the output of a projection in a different data type."""
+
+    proj: Linear | TiedProjection
+    dtype: DataType
+
+    def __init__(self, proj: Linear | TiedProjection, dtype: DataType) -> None:
+        super().__init__(proj.input_dim, proj.output_dim)
+
+        self.proj = proj
+
+        self.dtype = dtype
+
+    @override
+    def forward(self, x: Tensor) -> Tensor:
+        weight, bias = self.proj.weight, self.proj.bias
+
+        # The cast copies are only alive during the call.
+        if bias is not None:
+            bias = bias.to(self.dtype)
+
+        return linear(x.to(self.dtype), weight.to(self.dtype), bias)
+
+    def extra_repr(self) -> str:
+        """:meta private:"""
+        return f"{super().extra_repr()}, dtype={self.dtype}"
+
+
+@final
+class MTEncoderOutputCache:
+    """
+    Holds the encoder output of the last evaluated batch so that the loss and
+    BLEU/chrF++ units of a direction encode each batch only once.
+    """
+
+    _batch: Seq2SeqBatch | None
+    _encoder_output: Tensor | None
+    _encoder_padding_mask: PaddingMask | None
+
+    def __init__(self) -> None:
+        self._batch = None
+        self._encoder_output = None
+        self._encoder_padding_mask = None
+
+    def put(
+        self,
+        batch: Seq2SeqBatch,
+        encoder_output: Tensor,
+        encoder_padding_mask: PaddingMask | None,
+    ) -> None:
+        """Store the encoder output of ``batch``, replacing any previous one."""
+        self._batch = batch
+        self._encoder_output = encoder_output
+        self._encoder_padding_mask = encoder_padding_mask
+
+    def pop(self, batch: Seq2SeqBatch) -> tuple[Tensor, PaddingMask | None] | None:
+        """
+        Return and evict the encoder output of ``batch``, or ``None`` if it is
+        not cached.
+        """
+        if self._batch is not batch or self._encoder_output is None:
+            return None
+
+        output = self._encoder_output, self._encoder_padding_mask
+
+        self._batch = None
+        self._encoder_output = None
+        self._encoder_padding_mask = None
+
+        return output
+
+
 @final
 class MTLossEvalUnit(AbstractEvalUnit[Seq2SeqBatch]):
     _criterion: MTCriterion
+    _encoder_output_cache: MTEncoderOutputCache | None
     _metric_bag: Seq2SeqMetricBag
 
     def __init__(
-        self, criterion: MTCriterion, direction: Direction, gangs: Gangs
+        self,
+        criterion: MTCriterion,
+        direction: Direction,
+        gangs: Gangs,
+        *,
+        encoder_output_cache: MTEncoderOutputCache | None = None,
     ) -> None:
+        """
+        :param criterion:
+            The criterion to compute the loss.
+        :param direction:
+            The language direction to evaluate.
+        :param gangs:
+            The gangs for distributed evaluation.
+        :param encoder_output_cache:
+            If not ``None``, the encoder output of each batch is stored in the
+            cache for reuse by a subsequent unit.
+        """
         super().__init__(criterion.model, display_name=f"loss/{direction}")
 
         self._criterion = criterion
 
+        self._encoder_output_cache = encoder_output_cache
+
         self._metric_bag = Seq2SeqMetricBag(gangs.dp, train=False)
 
     @override
     def __call__(self, batch: Seq2SeqBatch) -> None:
-        self._criterion(batch, self._metric_bag)
+        if self._encoder_output_cache is None:
+            self._criterion(batch, self._metric_bag)
+
+            return
+
+        encoder_output, encoder_padding_mask = self._criterion.encode(batch)
+
+        self._encoder_output_cache.put(batch, encoder_output, encoder_padding_mask)
+
+        self._criterion(
+            batch,
+            self._metric_bag,
+            encoder_output=encoder_output,
+            encoder_padding_mask=encoder_padding_mask,
+        )
 
     @property
     @override
@@ -308,14 +497,27 @@ class MTLossEvalUnit(AbstractEvalUnit[Seq2SeqBatch]):
         return self._metric_bag
 
 
+# The number of batches after which the dumped sentences are flushed.
+_DUMP_FLUSH_INTERVAL: Final = 32
+
+# The buffer size, in bytes, of the files to which sentences are dumped.
+_DUMP_BUFFER_SIZE: Final = 1024 * 1024
+
+
 @final
 class MTBleuChrfEvalUnit(AbstractEvalUnit[Seq2SeqBatch]):
     """Represents a machine translation BLEU/chrF++ evaluation unit."""
 
     _converter: SequenceToTextConverter
-    _src_output_stream: TextIO | None
-    _ref_output_stream: TextIO | None
-    _hyp_output_stream: TextIO | None
+    _target_lang: str
+    _max_batch_size: int | None
+    _encoder_output_cache: MTEncoderOutputCache | None
+    _output_stream: TextIO | None
+    _output_writer: _writer | None
+    _num_batches_since_flush: int
+    _example_checked: bool
+    _pending_refs: list[str]
+    _pending_hyps: list[str]
     _metric_bag: Seq2SeqGenerationMetricBag
 
     def __init__(
@@ -325,9 +527,10 @@ class MTBleuChrfEvalUnit(AbstractEvalUnit[Seq2SeqBatch]):
         tokenizer: TextTokenizer,
         gangs: Gangs,
         *,
-        src_output_stream: TextIO | None = None,
-        ref_output_stream: TextIO | None = None,
-        hyp_output_stream: TextIO | None = None,
+        converter: SequenceToTextConverter | None = None,
+        max_batch_size: int | None = None,
+        encoder_output_cache: MTEncoderOutputCache | None = None,
+        output_stream: TextIO | None = None,
     ) -> None:
         """
         :param direction:
@@ -338,22 +541,53 @@ class MTBleuChrfEvalUnit(AbstractEvalUnit[Seq2SeqBatch]):
             The tokenizer to encode target text.
         :param gang:
             The gang for distributed evaluation.
-        :param src_output_stream:
-            The output stream to dump sentences in the source language.
-        :param ref_output_stream:
-            The output stream to dump references.
-        :param hyp_output_stream:
-            The output stream to dump hypotheses.
+        :param converter:
+            The converter to translate source sequences. Can be shared by the
+            units of different directions since its target language is set
+            before each batch. If ``None``, a new converter is created.
+        :param max_batch_size:
+            The maximum number of sequences to pass to ``generator`` at once.
+            Larger batches are split into chunks. If ``None``, batches are
+            passed as is.
+        :param encoder_output_cache:
+            If not ``None``, reuses the encoder output of a batch if it was
+            already computed by a preceding unit.
+        :param output_stream:
+            The output stream to dump the source sentences, references, and
+            hypotheses. Each line holds a tab-separated source, reference, and
+            hypothesis triplet, quoted as in :mod:`csv` if a field contains a
+            tab, a newline, or a double quote.
         """
         super().__init__(generator.model, display_name=f"score/{direction}")
 
-        self._converter = SequenceToTextConverter(
-            generator, tokenizer, "translation", direction.target_lang
-        )
+        if converter is None:
+            converter = SequenceToTextConverter(
+                generator, tokenizer, "translation", direction.target_lang
+            )
+
+        self._converter = converter
+
+        self._target_lang = direction.target_lang
+
+        self._max_batch_size = max_batch_size
+
+        self._encoder_output_cache = encoder_output_cache
+
+        self._output_stream = output_stream
+
+        if output_stream is not None:
+            self._output_writer = csv.writer(
+                output_stream, delimiter="\t", lineterminator="\n"
+            )
+        else:
+            self._output_writer = None
+
+        self._num_batches_since_flush = 0
+
+        self._example_checked = False
 
-        self._src_output_stream = src_output_stream
-        self._ref_output_stream = ref_output_stream
-        self._hyp_output_stream = hyp_output_stream
+        self._pending_refs = []
+        self._pending_hyps = []
 
         self._metric_bag = Seq2SeqGenerationMetricBag(gangs.dp)
 
@@ -369,6 +603,79 @@ class MTBleuChrfEvalUnit(AbstractEvalUnit[Seq2SeqBatch]):
 
     @override
     def __call__(self, batch: Seq2SeqBatch) -> None:
+        # The schema of the examples does not change between batches of a
+        # data reader, so it is enough to validate the first one.
+        if not self._example_checked:
+            self._check_example(batch)
+
+            self._example_checked = True
+
+        example = cast(Mapping[str, Iterable[str]], batch.example)
+
+        srcs = example["source_text"]
+        refs = example["target_text"]
+
+        encoder_output: Tensor | None = None
+        encoder_padding_mask: PaddingMask | None = None
+
+        if self._encoder_output_cache is not None:
+            cached_output = self._encoder_output_cache.pop(batch)
+            if cached_output is not None:
+                encoder_output, encoder_padding_mask = cached_output
+
+        self._converter.set_target_lang(self._target_lang)
+
+        hyps: list[str] = []
+
+        batch_size = batch.source_seqs.size(0)
+
+        chunk_size = self._max_batch_size or batch_size
+
+        for offset in range(0, batch_size, chunk_size):
+            source_seqs, source_padding_mask = self._slice_seqs(
+                batch.source_seqs, batch.source_padding_mask, offset, chunk_size
+            )
+
+            if encoder_output is None:
+                chunk_encoder_output, chunk_encoder_padding_mask = None, None
+            else:
+                chunk_encoder_output, chunk_encoder_padding_mask = self._slice_seqs(
+                    encoder_output, encoder_padding_mask, offset, chunk_size
+                )
+
+            chunk_hyps, output = self._converter.batch_convert(
+                source_seqs,
+                source_padding_mask,
+                encoder_output=chunk_encoder_output,
+                encoder_padding_mask=chunk_encoder_padding_mask,
+            )
+
+            hyps.extend(chunk_hyps)
+
+            if source_padding_mask is None:
+                num_source_elements = source_seqs.numel()
+            else:
+                num_source_elements = int(source_padding_mask.seq_lens.sum())
+
+            self._metric_bag.update_batch_metrics(output, num_source_elements)
+
+        # BLEU and chrF++ are updated once in `finalize()` over all sentences
+        # instead of per batch.
+        self._pending_refs.extend(refs)
+        self._pending_hyps.extend(hyps)
+
+        # Dump source sentences, references, and hypotheses.
+        writer = self._output_writer
+        if writer is not None:
+            writer.writerows(zip(srcs, refs, hyps))
+
+            self._num_batches_since_flush += 1
+
+            if self._num_batches_since_flush == _DUMP_FLUSH_INTERVAL:
+                self._flush_output_stream()
+
+    @staticmethod
+    def _check_example(batch: Seq2SeqBatch) -> None:
         if batch.example is None:
             raise ValueError("`batch.example` must not be `None`.")
 
@@ -401,41 +708,40 @@ class MTBleuChrfEvalUnit(AbstractEvalUnit[Seq2SeqBatch]):
                 f"`batch.example['target_text'] must be an iterable of strings, but is of type `{type(refs)}` instead."
             )
 
-        hyps, output = self._converter.batch_convert(
-            batch.source_seqs, batch.source_padding_mask
-        )
+    @staticmethod
+    def _slice_seqs(
+        seqs: Tensor, padding_mask: PaddingMask | None, offset: int, size: int
+    ) -> tuple[Tensor, PaddingMask | None]:
+        if offset == 0 and seqs.size(0) <= size:
+            return seqs, padding_mask
 
-        self._metric_bag.bleu.update(refs, hyps)
-        self._metric_bag.chrf.update(refs, hyps)
+        seqs = seqs[offset : offset + size]
 
-        self._metric_bag.update_batch_metrics(output, batch.num_source_elements())
+        if padding_mask is None:
+            return seqs, None
 
-        # Dump source sentences.
-        stream = self._src_output_stream
-        if stream is not None:
-            for src in srcs:
-                stream.write(src)
-                stream.write("\n")
+        seq_lens = padding_mask.seq_lens[offset : offset + size]
 
-            stream.flush()
+        # The padding is kept as is; batches are already bucketed by length and
+        # trimming would undo any length rounding of the data reader.
+        return seqs, PaddingMask(seq_lens, seqs.size(1))
 
-        # Dump references.
-        stream = self._ref_output_stream
-        if stream is not None:
-            for ref in refs:
-                stream.write(ref)
-                stream.write("\n")
+    def _flush_output_stream(self) -> None:
+        if self._output_stream is not None:
+            self._output_stream.flush()
 
-            stream.flush()
+        self._num_batches_since_flush = 0
+
+    @override
+    def finalize(self) -> None:
+        if self._pending_hyps:
+            self._metric_bag.bleu.update(self._pending_refs, self._pending_hyps)
+            self._metric_bag.chrf.update(self._pending_refs, self._pending_hyps)
 
-        # Dump hypotheses.
-        stream = self._hyp_output_stream
-        if stream is not None:
-            for hyp in hyps:
-                stream.write(hyp)
-                stream.write("\n")
+            self._pending_refs = []
+            self._pending_hyps = []
 
-            stream.flush()
+        self._flush_output_stream()
 
     @property
     @override
@@ -906,6 +906,8 @@ class Trainer(StatefulObjectBag, Generic[BatchT]):
 
         self._progress.remove_task(valid_task)
 
+        unit.finalize()
+
         data_reader.reset()
 
         metric_values = self._publish_validation_metrics(
@@ -6,32 +6,20 @@
 
 from __future__ import annotations
 
+from threading import RLock
+
 from fairseq2.assets import InProcAssetDownloadManager, StandardAssetStore
 from fairseq2.context import RuntimeContext, get_runtime_context, set_runtime_context
 from fairseq2.extensions import run_extensions
-from fairseq2.setup._assets import _register_assets
-from fairseq2.setup._chatbots import _register_chatbots
-from fairseq2.setup._clusters import _register_clusters
-from fairseq2.setup._config import _register_config_sections
-from fairseq2.setup._datasets import _register_datasets
-from fairseq2.setup._generation import (
-    _register_beam_search_algorithms,
-    _register_samplers,
-    _register_seq2seq_generators,
-    _register_seq_generators,
-)
-from fairseq2.setup._metrics import (
-    _register_metric_descriptors,
-    _register_metric_recorders,
-)
-from fairseq2.setup._models import _register_models
-from fairseq2.setup._optim import _register_lr_schedulers, _register_optimizers
-from fairseq2.setup._recipes import _register_recipes
-from fairseq2.setup._text_tokenizers import _register_text_tokenizers
 from fairseq2.utils.file import StandardFileSystem
 
 _setup_called: bool = False
 
+_setup_done: bool = False
+
+# Reentrant since extensions might call `setup_fairseq2()` during setup.
+_setup_lock = RLock()
+
 
 def setup_fairseq2() -> RuntimeContext:
     """
@@ -47,21 +35,50 @@ def setup_fairseq2() -> RuntimeContext:
 
     .. __: https://setuptools.pypa.io/en/latest/userguide/entry_point.html
     """
-    global _setup_called
+    global _setup_called, _setup_done
+
+    if _setup_done:
+        return get_runtime_context()
+
+    with _setup_lock:
+        if _setup_called:
+            return get_runtime_context()
 
-    if _setup_called:
-        context = get_runtime_context()
-    else:
         _setup_called = True  # Avoid recursive calls.
 
         context = setup_runtime_context()
 
         set_runtime_context(context)
 
+        _setup_done = True
+
     return context
 
 
 def setup_runtime_context() -> RuntimeContext:
+    # The registration functions pull in most of fairseq2 (and its heavy
+    # dependencies). Import them lazily so that `import fairseq2` stays cheap
+    # until the runtime context is actually set up.
+    from fairseq2.setup._assets import _register_assets
+    from fairseq2.setup._chatbots import _register_chatbots
+    from fairseq2.setup._clusters import _register_clusters
+    from fairseq2.setup._config import _register_config_sections
+    from fairseq2.setup._datasets import _register_datasets
+    from fairseq2.setup._generation import (
+        _register_beam_search_algorithms,
+        _register_samplers,
+        _register_seq2seq_generators,
+        _register_seq_generators,
+    )
+    from fairseq2.setup._metrics import (
+        _register_metric_descriptors,
+        _register_metric_recorders,
+    )
+    from fairseq2.setup._models import _register_models
+    from fairseq2.setup._optim import _register_lr_schedulers, _register_optimizers
+    from fairseq2.setup._recipes import _register_recipes
+    from fairseq2.setup._text_tokenizers import _register_text_tokenizers
+
     asset_store = StandardAssetStore()
 
     asset_download_manager = InProcAssetDownloadManager()
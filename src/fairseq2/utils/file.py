@@ -41,11 +41,15 @@ class FileSystem(ABC):
         ...
 
     @abstractmethod
-    def open(self, path: Path, mode: FileMode = FileMode.READ) -> BinaryIO:
+    def open(
+        self, path: Path, mode: FileMode = FileMode.READ, *, buffering: int = -1
+    ) -> BinaryIO:
         ...
 
     @abstractmethod
-    def open_text(self, path: Path, mode: FileMode = FileMode.READ) -> TextIO:
+    def open_text(
+        self, path: Path, mode: FileMode = FileMode.READ, *, buffering: int = -1
+    ) -> TextIO:
         ...
 
     @abstractmethod
@@ -98,7 +102,9 @@ class StandardFileSystem(FileSystem):
         return path.is_dir()
 
     @override
-    def open(self, path: Path, mode: FileMode = FileMode.READ) -> BinaryIO:
+    def open(
+        self, path: Path, mode: FileMode = FileMode.READ, *, buffering: int = -1
+    ) -> BinaryIO:
         match mode:
             case FileMode.READ:
                 m = "rb"
@@ -111,12 +117,14 @@ class StandardFileSystem(FileSystem):
                     f"`mode` must be a valid `FileMode` value, but is `{mode}` instead."
                 )
 
-        fp = path.open(m)
+        fp = path.open(m, buffering=buffering)
 
         return cast(BinaryIO, fp)
 
     @override
-    def open_text(self, path: Path, mode: FileMode = FileMode.READ) -> TextIO:
+    def open_text(
+        self, path: Path, mode: FileMode = FileMode.READ, *, buffering: int = -1
+    ) -> TextIO:
         match mode:
             case FileMode.READ:
                 m = "r"
@@ -129,7 +137,7 @@ class StandardFileSystem(FileSystem):
                     f"`mode` must be a valid `FileMode` value, but is `{mode}` instead."
                 )
 
-        fp = path.open(m)
+        fp = path.open(m, buffering=buffering)
 
         return cast(TextIO, fp)
 
@@ -63,7 +63,15 @@ class AbstractProfiler(Profiler):
 class TorchProfiler(AbstractProfiler):
     """Represents a convenience wrapper for :class:`profile`."""
 
-    _profile: profile
+    _skip_first: int
+    _active: int
+    _log_dir: Path
+    _gang: Gang
+    _record_shapes: bool
+    _with_stack: bool
+    _running: bool
+    _step_nr: int
+    _profile: profile | None
 
     def __init__(
         self,
@@ -71,6 +79,9 @@ class TorchProfiler(AbstractProfiler):
         active: int,
         log_dir: Path,
         gang: Gang,
+        *,
+        record_shapes: bool = False,
+        with_stack: bool = False,
     ) -> None:
         """
         :param skip_first: The number of steps to skip at the beginning of the
@@ -79,45 +90,97 @@ class TorchProfiler(AbstractProfiler):
         :param log_dir: The TensorBoard log directory under which to store the
             trace files.
         :param gang: The associated gang.
+        :param record_shapes: If ``True``, records the input shapes of
+            operators.
+        :param with_stack: If ``True``, records the source information (i.e.
+            Python stack) of operators.
         """
         if skip_first <= 0:
             raise ValueError("`skip_first` must be greater than zero.")
 
-        activities = [ProfilerActivity.CPU, ProfilerActivity.CUDA]
+        self._skip_first = skip_first
+        self._active = active
+        self._log_dir = log_dir
+        self._gang = gang
+        self._record_shapes = record_shapes
+        self._with_stack = with_stack
 
-        schedule_ = schedule(
-            skip_first=skip_first - 1, wait=0, warmup=1, active=active, repeat=1
-        )
+        self._running = False
 
-        trace_handler = tensorboard_trace_handler(
-            str(log_dir), worker_name=f"rank_{gang.rank}", use_gzip=True
-        )
+        self._step_nr = 0
 
-        self._profile = profile(
-            activities=activities,
-            schedule=schedule_,
-            on_trace_ready=trace_handler,
-            record_shapes=True,
-            with_stack=True,
-        )
+        # Constructed at the warm-up step so that no profiling state is set up
+        # during the skipped steps.
+        self._profile = None
 
     @override
     def start(self) -> None:
+        if self._running:
+            return
+
+        self._running = True
+
         if self._profile is not None:
             self._profile.start()
+        else:
+            self._maybe_start_profile()
 
     @override
     def stop(self) -> None:
+        if not self._running:
+            return
+
+        self._running = False
+
         if self._profile is not None:
             self._profile.stop()
 
     @override
     def step(self) -> None:
+        if not self._running:
+            return
+
         if self._profile is not None:
             self._profile.step()
+        else:
+            self._step_nr += 1
+
+            self._maybe_start_profile()
+
+    def _maybe_start_profile(self) -> None:
+        if self._active <= 0 or self._step_nr != self._skip_first - 1:
+            return
+
+        self._profile = self._create_profile()
+
+        self._profile.start()
+
+    def _create_profile(self) -> profile:
+        activities = [ProfilerActivity.CPU, ProfilerActivity.CUDA]
+
+        # The skipped steps are already counted by `step()`.
+        schedule_ = schedule(
+            skip_first=0, wait=0, warmup=1, active=self._active, repeat=1
+        )
+
+        trace_handler = tensorboard_trace_handler(
+            str(self._log_dir), worker_name=f"rank_{self._gang.rank}", use_gzip=True
+        )
+
+        return profile(
+            activities=activities,
+            schedule=schedule_,
+            on_trace_ready=trace_handler,
+            record_shapes=self._record_shapes,
+            with_stack=self._with_stack,
+        )
 
     @property
-    def wrapped_profile(self) -> profile:
+    def wrapped_profile(self) -> profile | None:
+        """
+        The wrapped profile, or ``None`` if the warm-up step has not been
+        reached yet.
+        """
         return self._profile
 
 
@@ -142,14 +205,16 @@ class Stopwatch:
 
     _start_time: float | None
     _device: Device | None
+    _start_event: torch.cuda.Event | None
+    _end_event: torch.cuda.Event | None
 
     def __init__(self, *, start: bool = False, device: Device | None = None) -> None:
         """
         :param start: If ``True``, starts the stopwatch immediately.
-        :param device: If not ``None``, waits for all operations on ``device``
-            to complete before measuring the elapsed time. Note that this can
-            have a negative impact on the runtime performance if not used
-            carefully.
+        :param device: If not ``None``, includes the operations queued on
+            ``device`` in the elapsed time. For CUDA devices, the time is
+            measured with CUDA events on the current stream, so only reading
+            the elapsed time waits for the queued operations to complete.
         """
         self._start_time = None
 
@@ -161,6 +226,13 @@ class Stopwatch:
 
         self._device = device
 
+        if device is not None and device.type == "cuda":
+            self._start_event = torch.cuda.Event(enable_timing=True)
+            self._end_event = torch.cuda.Event(enable_timing=True)
+        else:
+            self._start_event = None
+            self._end_event = None
+
         if start:
             self.start()
 
@@ -169,9 +241,7 @@ class Stopwatch:
         if self._start_time is not None:
             raise InvalidOperationError("The stopwatch is already running.")
 
-        self._sync_device()
-
-        self._start_time = perf_counter()
+        self._record_start()
 
     def stop(self) -> None:
         """Stop the stopwatch."""
@@ -182,22 +252,28 @@ class Stopwatch:
         if self._start_time is None:
             raise InvalidOperationError("The stopwatch is not running.")
 
-        self._sync_device()
-
-        self._start_time = perf_counter()
+        self._record_start()
 
     def get_elapsed_time(self) -> float:
         """Return the elapsed time since the last :meth:`start` or :meth:`reset`."""
         if self._start_time is None:
             return 0.0
 
-        self._sync_device()
+        if self._start_event is None or self._end_event is None:
+            return perf_counter() - self._start_time
+
+        self._end_event.record(torch.cuda.current_stream(self._device))
+
+        self._end_event.synchronize()
 
-        return perf_counter() - self._start_time
+        # CUDA events report milliseconds.
+        return self._start_event.elapsed_time(self._end_event) / 1000.0
 
-    def _sync_device(self) -> None:
-        if self._device is not None and self._device.type == "cuda":
-            torch.cuda.synchronize(self._device)
+    def _record_start(self) -> None:
+        if self._start_event is not None:
+            self._start_event.record(torch.cuda.current_stream(self._device))
+
+        self._start_time = perf_counter()
 
     def __enter__(self) -> Self:
         if self._start_time is None:
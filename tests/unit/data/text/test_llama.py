@@ -0,0 +1,191 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from fairseq2.data.text.tokenizers import TextTokenizer
+from fairseq2.data.text.tokenizers.llama import (
+    _MAX_NUM_CACHED_TOKENIZERS,
+    LLaMATokenizerHandler,
+    _load_cached_tokenizer,
+    _tokenizer_cache_lock,
+)
+
+
+class _FakeLoader:
+    num_calls: int
+
+    def __init__(self) -> None:
+        self.num_calls = 0
+
+    def __call__(self) -> TextTokenizer:
+        self.num_calls += 1
+
+        return cast(TextTokenizer, object())
+
+
+@pytest.fixture(autouse=True)
+def clear_tokenizer_cache() -> Iterator[None]:
+    LLaMATokenizerHandler.clear_cache()
+
+    yield
+
+    LLaMATokenizerHandler.clear_cache()
+
+
+class TestLoadCachedTokenizer:
+    def test_call_returns_cached_tokenizer_when_file_is_unchanged(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path.joinpath("tokenizer.model")
+
+        path.write_bytes(b"foo")
+
+        loader = _FakeLoader()
+
+        tokenizer1 = _load_cached_tokenizer(path, True, loader)
+        tokenizer2 = _load_cached_tokenizer(path, True, loader)
+
+        assert tokenizer1 is tokenizer2
+
+        assert loader.num_calls == 1
+
+    def test_call_keys_on_instruct(self, tmp_path: Path) -> None:
+        path = tmp_path.joinpath("tokenizer.model")
+
+        path.write_bytes(b"foo")
+
+        loader = _FakeLoader()
+
+        tokenizer1 = _load_cached_tokenizer(path, True, loader)
+        tokenizer2 = _load_cached_tokenizer(path, False, loader)
+
+        assert tokenizer1 is not tokenizer2
+
+        assert loader.num_calls == 2
+
+    def test_call_reloads_tokenizer_when_file_size_changes(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path.joinpath("tokenizer.model")
+
+        path.write_bytes(b"foo")
+
+        loader = _FakeLoader()
+
+        tokenizer1 = _load_cached_tokenizer(path, None, loader)
+
+        stat = path.stat()
+
+        path.write_bytes(b"foobar")
+
+        # Keep the modification time to make sure that the size alone
+        # invalidates the entry.
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        tokenizer2 = _load_cached_tokenizer(path, None, loader)
+
+        assert tokenizer1 is not tokenizer2
+
+        assert loader.num_calls == 2
+
+    def test_call_reloads_tokenizer_when_file_mtime_changes(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path.joinpath("tokenizer.model")
+
+        path.write_bytes(b"foo")
+
+        loader = _FakeLoader()
+
+        tokenizer1 = _load_cached_tokenizer(path, None, loader)
+
+        stat = path.stat()
+
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        tokenizer2 = _load_cached_tokenizer(path, None, loader)
+
+        assert tokenizer1 is not tokenizer2
+
+        assert loader.num_calls == 2
+
+    def test_call_does_not_cache_when_file_does_not_exist(self, tmp_path: Path) -> None:
+        path = tmp_path.joinpath("tokenizer.model")
+
+        loader = _FakeLoader()
+
+        _load_cached_tokenizer(path, None, loader)
+        _load_cached_tokenizer(path, None, loader)
+
+        assert loader.num_calls == 2
+
+    def test_clear_cache_evicts_tokenizers(self, tmp_path: Path) -> None:
+        path = tmp_path.joinpath("tokenizer.model")
+
+        path.write_bytes(b"foo")
+
+        loader = _FakeLoader()
+
+        tokenizer1 = _load_cached_tokenizer(path, None, loader)
+
+        LLaMATokenizerHandler.clear_cache()
+
+        tokenizer2 = _load_cached_tokenizer(path, None, loader)
+
+        assert tokenizer1 is not tokenizer2
+
+        assert loader.num_calls == 2
+
+    def test_call_evicts_least_recently_used_tokenizer(self, tmp_path: Path) -> None:
+        paths = []
+
+        for idx in range(_MAX_NUM_CACHED_TOKENIZERS + 1):
+            path = tmp_path.joinpath(f"tokenizer{idx}.model")
+
+            path.write_bytes(b"foo")
+
+            paths.append(path)
+
+        loader = _FakeLoader()
+
+        for path in paths[:-1]:
+            _load_cached_tokenizer(path, None, loader)
+
+        # Mark the first tokenizer as recently used.
+        _load_cached_tokenizer(paths[0], None, loader)
+
+        _load_cached_tokenizer(paths[-1], None, loader)
+
+        assert loader.num_calls == _MAX_NUM_CACHED_TOKENIZERS + 1
+
+        _load_cached_tokenizer(paths[0], None, loader)
+
+        assert loader.num_calls == _MAX_NUM_CACHED_TOKENIZERS + 1
+
+        # The second tokenizer was the least recently used one.
+        _load_cached_tokenizer(paths[1], None, loader)
+
+        assert loader.num_calls == _MAX_NUM_CACHED_TOKENIZERS + 2
+
+    def test_call_does_not_hold_lock_while_loading(self, tmp_path: Path) -> None:
+        path = tmp_path.joinpath("tokenizer.model")
+
+        path.write_bytes(b"foo")
+
+        def loader() -> TextTokenizer:
+            assert not _tokenizer_cache_lock.locked()
+
+            return cast(TextTokenizer, object())
+
+        _load_cached_tokenizer(path, None, loader)
@@ -0,0 +1,97 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from __future__ import annotations
+
+import pytest
+from tiktoken import Encoding
+
+from fairseq2.data.text.tokenizers.tiktoken import (
+    TiktokenEncoder,
+    _split_long_runs,
+    _split_text,
+)
+
+_SPLIT_REGEX = r"""(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\p{L}\p{N}]?\p{L}+|\p{N}{1,3}| ?[^\s\p{L}\p{N}]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"""  # fmt: skip
+
+_CORPUS = [
+    "The quick brown fox jumps over the lazy dog.",
+    "  Leading and trailing whitespace  ",
+    "Tabs\tand\nnewlines\r\nare whitespace too.",
+    "Numbers like 12345 and 3.14159 are split into groups.",
+    "Ünïcödé テキスト and emojis 🙂 are encoded as bytes.",
+    "",
+]
+
+
+def _make_encoding() -> Encoding:
+    mergeable_ranks = {bytes([i]): i for i in range(256)}
+
+    for token in (b"th", b"he", b"the", b" t", b" the", b"  "):
+        mergeable_ranks[token] = len(mergeable_ranks)
+
+    return Encoding(
+        name="test",
+        pat_str=_SPLIT_REGEX,
+        mergeable_ranks=mergeable_ranks,
+        special_tokens={},
+    )
+
+
+class TestSplitLongRuns:
+    @pytest.mark.parametrize("max_run_len", [1, 2, 3, 7, 1000])
+    def test_call_round_trips_text(self, max_run_len: int) -> None:
+        for text in _CORPUS + ["a" * 20 + " " * 15 + "bc" * 10]:
+            pieces = list(_split_long_runs(text, max_run_len))
+
+            assert "".join(pieces) == text
+
+    def test_call_splits_runs_longer_than_limit(self) -> None:
+        pieces = list(_split_long_runs("ab " + "c" * 7 + "  d", max_run_len=3))
+
+        assert pieces == ["ab ccc", "ccc", "c  d"]
+
+    def test_call_does_not_split_text_without_long_runs(self) -> None:
+        text = " ".join(_CORPUS)
+
+        assert list(_split_long_runs(text, max_run_len=1000)) == [text]
+
+
+class TestSplitText:
+    def test_call_round_trips_long_text(self) -> None:
+        text = "x" * 60_000 + " " * 30_000 + "the end"
+
+        pieces = list(_split_text(text))
+
+        assert len(pieces) > 1
+
+        assert "".join(pieces) == text
+
+
+class TestTiktokenEncoder:
+    def test_call_returns_same_indices_as_encoding(self) -> None:
+        encoding = _make_encoding()
+
+        encoder = TiktokenEncoder(encoding)
+
+        for text in _CORPUS:
+            indices = encoder(text).tolist()
+
+            assert indices == encoding.encode(text, allowed_special="all")
+
+    def test_call_returns_same_indices_as_encoding_when_text_is_long(
+        self,
+    ) -> None:
+        encoding = _make_encoding()
+
+        encoder = TiktokenEncoder(encoding)
+
+        # Longer than the split threshold, but without any long runs.
+        text = " ".join(_CORPUS * 1000)
+
+        indices = encoder(text).tolist()
+
+        assert indices == encoding.encode(text, allowed_special="all")
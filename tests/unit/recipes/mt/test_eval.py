@@ -0,0 +1,128 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from __future__ import annotations
+
+from typing import cast
+
+import torch
+from torch.nn import Module
+from torch.nn.functional import linear
+
+from fairseq2.models.encoder_decoder import EncoderDecoderModel
+from fairseq2.models.seq2seq import Seq2SeqBatch
+from fairseq2.nn import StandardEmbedding, TiedProjection
+from fairseq2.recipes.mt import MTEncoderOutputCache
+from fairseq2.recipes.mt._eval import _set_logits_dtype
+from tests.common import assert_close, device
+
+
+def _make_batch() -> Seq2SeqBatch:
+    seqs = torch.ones((2, 4), device=device, dtype=torch.int64)
+
+    return Seq2SeqBatch(seqs, None, seqs, None)
+
+
+class TestMTEncoderOutputCache:
+    def test_pop_returns_output_of_same_batch(self) -> None:
+        cache = MTEncoderOutputCache()
+
+        batch = _make_batch()
+
+        encoder_output = torch.zeros((2, 4, 8), device=device)
+
+        cache.put(batch, encoder_output, None)
+
+        output = cache.pop(batch)
+
+        assert output is not None
+
+        assert output[0] is encoder_output
+        assert output[1] is None
+
+    def test_pop_returns_none_for_other_batch(self) -> None:
+        cache = MTEncoderOutputCache()
+
+        batch1 = _make_batch()
+        batch2 = _make_batch()
+
+        # `batch1` and `batch2` are equal, but they are not the same object.
+        cache.put(batch1, torch.zeros((2, 4, 8), device=device), None)
+
+        assert cache.pop(batch2) is None
+
+        assert cache.pop(batch1) is not None
+
+    def test_pop_evicts_output(self) -> None:
+        cache = MTEncoderOutputCache()
+
+        batch = _make_batch()
+
+        cache.put(batch, torch.zeros((2, 4, 8), device=device), None)
+
+        assert cache.pop(batch) is not None
+
+        assert cache.pop(batch) is None
+
+    def test_put_replaces_previous_output(self) -> None:
+        cache = MTEncoderOutputCache()
+
+        batch1 = _make_batch()
+        batch2 = _make_batch()
+
+        cache.put(batch1, torch.zeros((2, 4, 8), device=device), None)
+
+        encoder_output = torch.ones((2, 4, 8), device=device)
+
+        cache.put(batch2, encoder_output, None)
+
+        assert cache.pop(batch1) is None
+
+        output = cache.pop(batch2)
+
+        assert output is not None
+
+        assert output[0] is encoder_output
+
+
+class _TiedModel(Module):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.embed = StandardEmbedding(
+            num_embeddings=32, embedding_dim=8, device=device, dtype=torch.float16
+        )
+
+        self.final_proj = TiedProjection(self.embed.weight, bias=None)
+
+
+class TestSetLogitsDType:
+    def test_call_does_not_cast_tied_embedding(self) -> None:
+        model = _TiedModel()
+
+        _set_logits_dtype(cast(EncoderDecoderModel, model), torch.float32)
+
+        assert model.embed.weight.dtype == torch.float16
+
+        # No cast copy of the tied weight is held by the model.
+        assert len(list(model.parameters())) == 1
+
+        assert len(list(model.buffers())) == 0
+
+    def test_call_computes_logits_in_dtype(self) -> None:
+        model = _TiedModel()
+
+        weight = model.embed.weight.detach().clone()
+
+        _set_logits_dtype(cast(EncoderDecoderModel, model), torch.float32)
+
+        x = torch.randn((2, 3, 8), device=device, dtype=torch.float16)
+
+        logits = model.final_proj(x)
+
+        assert logits.dtype == torch.float32
+
+        assert_close(logits, linear(x.float(), weight.float()))
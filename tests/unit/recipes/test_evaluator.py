@@ -0,0 +1,226 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import pytest
+from torch.nn import Module
+from typing_extensions import Self, override
+
+from fairseq2.datasets import DataReader
+from fairseq2.gang import fake_gangs
+from fairseq2.metrics import MetricBag
+from fairseq2.metrics.recorders import MetricRecorder
+from fairseq2.recipes.evaluator import AbstractEvalUnit, Evaluator
+from fairseq2.typing import CPU
+from fairseq2.utils.profiler import Stopwatch
+from tests.common import device
+
+
+class _FakeClock:
+    time: float
+
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class _FakeDataReader(DataReader[int]):
+    _batches: list[int]
+    _events: list[str]
+    _clock: _FakeClock | None
+    _read_time: float
+    _idx: int
+
+    def __init__(
+        self,
+        batches: list[int],
+        events: list[str],
+        clock: _FakeClock | None = None,
+        read_time: float = 0.0,
+    ) -> None:
+        self._batches = batches
+        self._events = events
+        self._clock = clock
+        self._read_time = read_time
+        self._idx = 0
+
+    @override
+    def __iter__(self) -> Self:
+        return self
+
+    @override
+    def __next__(self) -> list[int]:
+        if self._idx == len(self._batches):
+            raise StopIteration()
+
+        batch = self._batches[self._idx]
+
+        self._idx += 1
+
+        if self._clock is not None:
+            self._clock.time += self._read_time
+
+        self._events.append(f"read {batch}")
+
+        return [batch]
+
+    @override
+    def reset(self) -> None:
+        self._idx = 0
+
+    @override
+    def state_dict(self) -> dict[str, object]:
+        return {}
+
+    @override
+    def load_state_dict(self, state_dict: Mapping[str, object]) -> None:
+        pass
+
+    @property
+    @override
+    def num_accumulate(self) -> int:
+        return 1
+
+
+class _FakeEvalUnit(AbstractEvalUnit[int]):
+    _name: str
+    _events: list[str]
+    _clock: _FakeClock | None
+    _call_time: float
+    _metric_bag: MetricBag
+
+    def __init__(
+        self,
+        name: str,
+        events: list[str],
+        clock: _FakeClock | None = None,
+        call_time: float = 0.0,
+    ) -> None:
+        super().__init__(Module(), display_name=name)
+
+        self._name = name
+        self._events = events
+        self._clock = clock
+        self._call_time = call_time
+
+        self._metric_bag = MetricBag(fake_gangs(device).root)
+
+    @override
+    def __call__(self, batch: int) -> None:
+        if self._clock is not None:
+            self._clock.time += self._call_time
+
+        self._events.append(f"{self._name} {batch}")
+
+    @override
+    def finalize(self) -> None:
+        self._events.append(f"finalize {self._name}")
+
+    @property
+    @override
+    def metric_bag(self) -> MetricBag:
+        return self._metric_bag
+
+
+class _FakeMetricRecorder(MetricRecorder):
+    elapsed_times: dict[str, float]
+
+    def __init__(self) -> None:
+        self.elapsed_times = {}
+
+    @override
+    def record_metrics(
+        self,
+        run: str,
+        values: Mapping[str, object],
+        step_nr: int | None = None,
+        *,
+        flush: bool = True,
+    ) -> None:
+        elapsed_time = values["elapsed_time"]
+
+        assert isinstance(elapsed_time, float)
+
+        self.elapsed_times[run] = elapsed_time
+
+    @override
+    def close(self) -> None:
+        pass
+
+
+class TestEvaluator:
+    def test_call_groups_units_sharing_data_reader(self) -> None:
+        events: list[str] = []
+
+        data_reader1 = _FakeDataReader([1, 2], events)
+        data_reader2 = _FakeDataReader([3], events)
+
+        unit1 = _FakeEvalUnit("foo", events)
+        unit2 = _FakeEvalUnit("bar", events)
+        unit3 = _FakeEvalUnit("baz", events)
+
+        evaluator = Evaluator[int](
+            units=[unit1, unit2, unit3],
+            data_readers=[data_reader1, data_reader1, data_reader2],
+            gangs=fake_gangs(device),
+            metric_recorders=[],
+            wall_watch=Stopwatch(start=True),
+        )
+
+        evaluator()
+
+        # The units of a group must all see a batch before the next batch is
+        # read, and must all be finalized before the next group starts.
+        assert events == [
+            "read 1",
+            "foo 1",
+            "bar 1",
+            "read 2",
+            "foo 2",
+            "bar 2",
+            "finalize foo",
+            "finalize bar",
+            "read 3",
+            "baz 3",
+            "finalize baz",
+        ]
+
+    def test_call_publishes_elapsed_time_per_unit(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        clock = _FakeClock()
+
+        monkeypatch.setattr("fairseq2.recipes.evaluator.perf_counter", clock)
+
+        events: list[str] = []
+
+        data_reader = _FakeDataReader([1, 2], events, clock, read_time=1.0)
+
+        unit1 = _FakeEvalUnit("foo", events, clock, call_time=2.0)
+        unit2 = _FakeEvalUnit("bar", events, clock, call_time=4.0)
+
+        recorder = _FakeMetricRecorder()
+
+        # Time on the host so that the fake clock is used.
+        evaluator = Evaluator[int](
+            units=[unit1, unit2],
+            data_readers=[data_reader, data_reader],
+            gangs=fake_gangs(CPU),
+            metric_recorders=[recorder],
+            wall_watch=Stopwatch(start=True),
+        )
+
+        evaluator()
+
+        # Both units include the time spent reading the two batches.
+        assert recorder.elapsed_times["eval/foo"] == 2.0 + 4.0
+
+        assert recorder.elapsed_times["eval/bar"] == 2.0 + 8.0